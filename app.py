@@ -1,6 +1,9 @@
 # app.py
 import math
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Custom exception for all expression-related errors
 class ExpressionError(Exception):
@@ -152,6 +155,7 @@ def validate_unary_parentheses(tokens: list) -> None:
     while i < len(tokens):
         if (tokens[i] == '(' and 
             i + 1 < len(tokens) and 
+            isinstance(tokens[i + 1], str) and 
             tokens[i + 1] in '+-'):
             
             # Check for unary expression: (+ or - followed by number and closing paren)
@@ -210,7 +214,9 @@ def validate_expression_structure(tokens: list) -> None:
             
             # Check for missing operand at end or before another operator
             if (i == len(tokens) - 1 or 
-                (i + 1 < len(tokens) and tokens[i + 1] in '+-*/%')):
+                (i + 1 < len(tokens) and 
+                 isinstance(tokens[i + 1], str) and 
+                 tokens[i + 1] in '+-*/%')):
                 raise ExpressionError("Missing operand")
 
 
@@ -326,6 +332,7 @@ def infix_to_postfix(tokens: list) -> list:
         # Handle unary expressions in parentheses
         elif (token == '(' and 
               i + 1 < len(tokens) and 
+              isinstance(tokens[i + 1], str) and 
               tokens[i + 1] in '+-' and
               i + 2 < len(tokens) and 
               isinstance(tokens[i + 2], (int, float)) and
@@ -408,6 +415,93 @@ def evaluate(expression: str) -> float:
     return result
 
 
+# ============================================================================
+# BATCH EVALUATION FUNCTIONS
+# ============================================================================
+
+def gil_enabled() -> bool:
+    """
+    Report whether the running interpreter has the GIL enabled.
+
+    Returns:
+        bool: False on a free-threaded build (e.g. python3.13t) running
+              without the GIL, True otherwise
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is None:
+        return True
+    return is_gil_enabled()
+
+
+def evaluate_or_error(expression: str):
+    """
+    Evaluate an expression, returning the ExpressionError instead of raising it.
+
+    Defined at module level so it can be pickled for process pools. For
+    string input the evaluator only raises ExpressionError; any other
+    exception (e.g. a non-string item) is a caller bug and propagates.
+
+    Args:
+        expression (str): The mathematical expression to evaluate
+
+    Returns:
+        float | ExpressionError: The result, or the error that was raised
+    """
+    try:
+        return evaluate(expression)
+    except ExpressionError as error:
+        return error
+
+
+def evaluate_batch(expressions: list, max_workers: int | None = None,
+                   mode: str = 'thread') -> list:
+    """
+    Evaluate many expressions concurrently.
+
+    The evaluation path keeps all of its state in local variables, so the
+    thread pool is safe on free-threaded builds where threads run in parallel.
+    The process pool avoids the GIL on standard builds at the cost of
+    worker startup and pickling.
+
+    Args:
+        expressions (list): Expression strings to evaluate
+        max_workers (int | None): Number of workers (defaults to the
+                                  executor's own)
+        mode (str): 'thread' or 'process'
+
+    Returns:
+        list: One entry per expression, in input order: the float result,
+              or the ExpressionError raised while evaluating it
+
+    Raises:
+        ValueError: For an unknown mode
+        Exception: Anything other than ExpressionError raised by an item
+                   (e.g. a non-string) propagates and aborts the batch
+    """
+    if mode == 'thread':
+        executor_class = ThreadPoolExecutor
+    elif mode == 'process':
+        executor_class = ProcessPoolExecutor
+    else:
+        raise ValueError("Unknown batch mode")
+
+    expressions = list(expressions)
+    if not expressions:
+        return []
+
+    with executor_class(max_workers=max_workers) as executor:
+        if mode == 'thread':
+            return list(executor.map(evaluate_or_error, expressions))
+
+        # Send each process a sizeable slice to amortise pickling round trips;
+        # the worker count mirrors ProcessPoolExecutor's own default
+        cpu_count = getattr(os, 'process_cpu_count', os.cpu_count)
+        workers = max_workers or cpu_count() or 1
+        chunksize = max(1, len(expressions) // (workers * 4))
+        return list(executor.map(evaluate_or_error, expressions,
+                                 chunksize=chunksize))
+
+
 # ============================================================================
 # TEST CASES FOR VERIFICATION
 # ============================================================================
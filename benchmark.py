@@ -0,0 +1,83 @@
+# benchmark.py
+"""
+Compare thread-pool and process-pool batch evaluation.
+
+Run it once under each interpreter you deploy on, e.g.:
+
+    python3 benchmark.py
+    python3.13t benchmark.py
+
+On a standard build the GIL serialises the thread pool, so processes usually
+win for large batches. On a free-threaded build threads run in parallel and
+skip the process pool's startup and pickling costs.
+"""
+import argparse
+import platform
+import time
+
+from app import evaluate_batch, evaluate_or_error, gil_enabled
+
+
+def build_expressions(count: int, length: int) -> list:
+    """
+    Build a batch of valid expressions of roughly equal cost.
+
+    Args:
+        count (int): Number of expressions in the batch
+        length (int): Number of terms in each expression
+
+    Returns:
+        list: Expression strings
+    """
+    expressions = []
+    for n in range(count):
+        terms = [f"({n % 7 + 1} * {k % 5 + 1.5} - (-{k % 3}))" for k in range(length)]
+        expressions.append(" + ".join(terms))
+    return expressions
+
+
+def time_run(function, repeat: int) -> float:
+    """
+    Return the best wall-clock time in seconds over several runs.
+
+    Args:
+        function: Zero-argument callable to time
+        repeat (int): Number of runs
+
+    Returns:
+        float: Fastest run in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000, help="expressions per batch")
+    parser.add_argument('--length', type=int, default=50, help="terms per expression")
+    parser.add_argument('--workers', type=int, default=None, help="pool size")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per mode")
+    args = parser.parse_args()
+
+    expressions = build_expressions(args.count, args.length)
+
+    print(f"Python {platform.python_version()} ({platform.python_implementation()}), "
+          f"GIL {'enabled' if gil_enabled() else 'disabled'}")
+    print(f"{args.count} expressions x {args.length} terms, best of {args.repeat}")
+
+    baseline = time_run(lambda: [evaluate_or_error(e) for e in expressions], args.repeat)
+    print(f"{'serial':<10}{baseline:>10.3f}s")
+
+    for mode in ('thread', 'process'):
+        elapsed = time_run(
+            lambda: evaluate_batch(expressions, max_workers=args.workers, mode=mode),
+            args.repeat)
+        print(f"{mode:<10}{elapsed:>10.3f}s  {baseline / elapsed:5.2f}x vs serial")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import unittest
 from app import evaluate
+from app import evaluate_batch
 from app import ExpressionError
 
 class TestEvaluate(unittest.TestCase):
@@ -251,5 +252,49 @@ class TestEvaluate(unittest.TestCase):
         expr = "1" + "+1" * 1000
         self.assertEqual(evaluate(expr), 1001)
 
+class TestEvaluateBatch(unittest.TestCase):
+    def test_batch_thread_results_in_order(self):
+        expressions = [f"{n} * 2" for n in range(100)]
+        self.assertEqual(evaluate_batch(expressions, max_workers=4),
+                         [n * 2 for n in range(100)])
+
+    def test_batch_process_matches_thread(self):
+        expressions = ["1 + 2", "(-3) * 4", "10 % 4", "2 / 0"]
+        threaded = evaluate_batch(expressions, mode='thread')
+        processed = evaluate_batch(expressions, max_workers=2, mode='process')
+        self.assertEqual(threaded[:3], processed[:3])
+        self.assertEqual(str(threaded[3]), str(processed[3]))
+
+    def test_batch_errors_returned(self):
+        results = evaluate_batch(["2 +", "4 / 2", ""])
+        self.assertIsInstance(results[0], ExpressionError)
+        self.assertEqual(str(results[0]), "Missing operand")
+        self.assertEqual(results[1], 2)
+        self.assertEqual(str(results[2]), "Expression is empty")
+
+    def test_batch_mixed_errors_per_slot(self):
+        expressions = ["1 + 2", "2 / 0", "(-3) * 4", "2 + a", "10 % 4", "(1"]
+        for mode in ('thread', 'process'):
+            results = evaluate_batch(expressions, max_workers=2, mode=mode)
+            self.assertEqual(results[0], 3)
+            self.assertEqual(str(results[1]), "Division by zero")
+            self.assertEqual(results[2], -12)
+            self.assertEqual(str(results[3]), "Invalid character in expression")
+            self.assertEqual(results[4], 2)
+            self.assertEqual(str(results[5]), "Mismatched parentheses")
+            for index in (1, 3, 5):
+                self.assertIsInstance(results[index], ExpressionError)
+
+    def test_batch_non_string_propagates(self):
+        with self.assertRaises(AttributeError):
+            evaluate_batch(["1 + 1", None])
+
+    def test_batch_empty(self):
+        self.assertEqual(evaluate_batch([]), [])
+
+    def test_batch_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            evaluate_batch(["1 + 1"], mode='fiber')
+
 if __name__ == "__main__":
     unittest.main()